@@ -1,6 +1,6 @@
 from . import config, html, log, web
 from .core import hooks
-from .core.component import Component, component
+from .core.component import Component, component, memo
 from .core.dispatcher import Stop
 from .core.events import EventHandler, event
 from .core.hooks import (
@@ -36,6 +36,7 @@ __all__ = [
     "html",
     "Layout",
     "log",
+    "memo",
     "multiview",
     "Ref",
     "run_sample_app",
@@ -41,6 +41,36 @@ be manually disablled by setting ``IDOM_CHECK_VDOM_SPEC=0`` in addition.
 For more info on the VDOM spec, see here: :ref:`VDOM JSON Schema`
 """
 
+IDOM_REUSE_EQUAL_MODELS = _Option(
+    "IDOM_REUSE_EQUAL_MODELS",
+    default=False,
+    validator=lambda x: bool(int(x)),
+)
+"""Skip re-rendering a component's model when its VDOM is equal to the last render's
+
+The string values ``1`` and ``0`` are mapped to ``True`` and ``False`` respectively.
+
+When a component renders, the VDOM it returns is compared to the VDOM it returned
+previously. If the two are equal, the model that was rendered last time is reused. This
+trades the cost of the comparison (which is wasted when the VDOM has changed) for the
+cost of re-rendering, so it is off by default.
+"""
+
+IDOM_FEATURE_HOIST_STATIC_MODELS = _Option(
+    "IDOM_FEATURE_HOIST_STATIC_MODELS",
+    default=False,
+    validator=lambda x: bool(int(x)),
+)
+"""Evaluate the VDOM of components which always return the same literal only once.
+
+When a component's function does nothing but return a literal dictionary (e.g.
+``return {"tagName": "hr"}``) that dictionary is created once when the component is
+defined and reused for every render, allowing the layout to skip re-rendering it.
+
+This requires inspecting the source of each component when it is defined, so it is off
+by default.
+"""
+
 # Because these web modules will be linked dynamically at runtime this can be temporary
 _DEFAULT_WEB_MODULES_DIR = TemporaryDirectory()
 
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import ast
 import inspect
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from textwrap import dedent
+from typing import Any, Callable, Dict, Optional, Tuple, Union, cast
+
+from idom.config import IDOM_FEATURE_HOIST_STATIC_MODELS
 
 from .proto import ComponentType, VdomDict
 
@@ -25,6 +29,11 @@ def component(
             f"Component render function {function} uses reserved parameter 'key'"
         )
 
+    if IDOM_FEATURE_HOIST_STATIC_MODELS.current:
+        static_model = _find_static_model(function)
+        if static_model is not None:
+            function = _make_static_render_function(function, static_model)
+
     @wraps(function)
     def constructor(*args: Any, key: Optional[Any] = None, **kwargs: Any) -> Component:
         if key_is_kwarg:
@@ -34,6 +43,78 @@ def component(
     return constructor
 
 
+def _find_static_model(function: Callable[..., Any]) -> Optional[VdomDict]:
+    """Return the model ``function`` always returns if its body is just a literal"""
+    if not inspect.isfunction(function) or hasattr(function, "__wrapped__"):
+        return None
+
+    try:
+        source = dedent(inspect.getsource(function))
+    except (OSError, TypeError):
+        return None
+
+    try:
+        module = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    func_def = module.body[0] if module.body else None
+    if not isinstance(func_def, ast.FunctionDef) or func_def.name != function.__name__:
+        return None
+
+    body = func_def.body
+    if ast.get_docstring(func_def) is not None:
+        body = body[1:]
+
+    if len(body) != 1 or not isinstance(body[0], ast.Return):
+        return None
+
+    returned = body[0].value
+    if returned is None:
+        return None
+
+    try:
+        model = ast.literal_eval(returned)
+    except (ValueError, TypeError, SyntaxError):
+        return None
+
+    if not isinstance(model, dict) or not isinstance(model.get("tagName"), str):
+        return None
+
+    return cast(VdomDict, model)
+
+
+def _make_static_render_function(
+    function: Callable[..., Any], model: VdomDict
+) -> Callable[..., VdomDict]:
+    @wraps(function)
+    def render_static_model(*args: Any, **kwargs: Any) -> VdomDict:
+        return model
+
+    return render_static_model
+
+
+def memo(
+    constructor: Callable[..., Component],
+    are_equal: Optional[Callable[[Component, Component], bool]] = None,
+) -> Callable[..., "MemoizedComponent"]:
+    """Skip re-rendering components whose props have not changed.
+
+    Parameters:
+        constructor: A component constructor (usually created with :func:`component`).
+        are_equal:
+            A function accepting the old and new :class:`Component` which returns
+            ``True`` if they should be considered equivalent. By default the props of
+            each component are compared.
+    """
+
+    @wraps(constructor)
+    def memo_constructor(*args: Any, **kwargs: Any) -> MemoizedComponent:
+        return MemoizedComponent(constructor(*args, **kwargs), are_equal)
+
+    return memo_constructor
+
+
 class Component:
     """An object for rending component models."""
 
@@ -69,3 +150,36 @@ class Component:
                 return f"{self._func.__name__}({id(self):02x}, {items})"
             else:
                 return f"{self._func.__name__}({id(self):02x})"
+
+
+class MemoizedComponent:
+    """A :class:`Component` which is only re-rendered when its props change."""
+
+    __slots__ = "__weakref__", "_component", "_are_equal", "key"
+
+    def __init__(
+        self,
+        component: Component,
+        are_equal: Optional[Callable[[Component, Component], bool]] = None,
+    ) -> None:
+        self._component = component
+        self._are_equal = are_equal or _props_are_equal
+        self.key = component.key
+
+    def render(self) -> VdomDict:
+        return self._component.render()
+
+    def should_render(self, old: Any) -> bool:
+        """Whether a layout must re-render this component in place of ``old``"""
+        if not isinstance(old, MemoizedComponent):
+            return True
+        return not self._are_equal(old._component, self._component)
+
+    def __repr__(self) -> str:
+        return repr(self._component)
+
+
+def _props_are_equal(old: Component, new: Component) -> bool:
+    return (
+        old._func is new._func and old._args == new._args and old._kwargs == new._kwargs
+    )
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import abc
 import asyncio
-from collections import Counter
 from functools import wraps
+from itertools import count
 from logging import getLogger
 from typing import (
     Any,
@@ -19,15 +19,13 @@ from typing import (
     Tuple,
     TypeVar,
 )
-from uuid import uuid4
-from weakref import ref as weakref
 
 from idom.config import (
     IDOM_CHECK_VDOM_SPEC,
     IDOM_DEBUG_MODE,
     IDOM_FEATURE_INDEX_AS_DEFAULT_KEY,
+    IDOM_REUSE_EQUAL_MODELS,
 )
-from idom.utils import Ref
 
 from ._event_proxy import _wrap_in_warning_event_proxies
 from .hooks import LifeCycleHook
@@ -38,9 +36,33 @@ from .vdom import validate_vdom_json
 logger = getLogger(__name__)
 
 
-class LayoutUpdate(NamedTuple):
+class _SlotsRecord:
+    """Base for the light weight records passed into and out of a :class:`Layout`
+
+    These behave like a ``NamedTuple`` (they can be unpacked and compared) but avoid
+    the cost of building a tuple each time one is created.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __iter__(self) -> Iterator[Any]:
+        return (getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class LayoutUpdate(_SlotsRecord):
     """A change to a view as a result of a :meth:`Layout.render`"""
 
+    __slots__ = ("path", "old", "new")
+
     path: str
     """A "/" delimited path to the element from the root of the layout"""
 
@@ -50,15 +72,26 @@ class LayoutUpdate(NamedTuple):
     new: VdomJson
     """The new state of the layout"""
 
+    def __init__(self, path: str, old: Optional[VdomJson], new: VdomJson) -> None:
+        self.path = path
+        self.old = old
+        self.new = new
+
 
-class LayoutEvent(NamedTuple):
+class LayoutEvent(_SlotsRecord):
     """An event that should be relayed to its handler by :meth:`Layout.deliver`"""
 
+    __slots__ = ("target", "data")
+
     target: str
     """The ID of the event handler."""
     data: List[Any]
     """A list of event data passed to the event handler."""
 
+    def __init__(self, target: str, data: List[Any]) -> None:
+        self.target = target
+        self.data = data
+
 
 _Self = TypeVar("_Self", bound="Layout")
 
@@ -70,6 +103,7 @@ class Layout:
         "root",
         "_event_handlers",
         "_rendering_queue",
+        "_target_counter",
         "_root_life_cycle_state_id",
         "_model_states_by_life_cycle_state_id",
     ]
@@ -86,9 +120,14 @@ class Layout:
     def __enter__(self: _Self) -> _Self:
         # create attributes here to avoid access before entering context manager
         self._event_handlers: EventHandlerDict = {}
+        self._target_counter = count()
 
         self._rendering_queue: _ThreadSafeQueue[_LifeCycleStateId] = _ThreadSafeQueue()
-        root_model_state = _new_root_model_state(self.root, self._rendering_queue.put)
+        root_model_state = _new_root_model_state(
+            self.root,
+            self._new_life_cycle_state_id(),
+            self._rendering_queue.put,
+        )
 
         self._root_life_cycle_state_id = root_id = root_model_state.life_cycle_state.id
         self._rendering_queue.put(root_id)
@@ -105,6 +144,7 @@ class Layout:
         # delete attributes here to avoid access after exiting context manager
         del self._event_handlers
         del self._rendering_queue
+        del self._target_counter
         del self._root_life_cycle_state_id
         del self._model_states_by_life_cycle_state_id
 
@@ -155,7 +195,7 @@ class Layout:
             # Ensure that the model is valid VDOM on each render
             root_id = self._root_life_cycle_state_id
             root_model = self._model_states_by_life_cycle_state_id[root_id]
-            validate_vdom_json(root_model.model.current)
+            validate_vdom_json(root_model.model)
             return result
 
     def _create_layout_update(self, old_state: _ModelState) -> LayoutUpdate:
@@ -165,20 +205,26 @@ class Layout:
         self._render_component(old_state, new_state, component)
 
         # hook effects must run after the update is complete
-        for model_state in _iter_model_state_children(new_state):
+        to_visit = [new_state]
+        while to_visit:
+            model_state = to_visit.pop()
             if hasattr(model_state, "life_cycle_state"):
                 model_state.life_cycle_state.hook.component_did_render()
+            # reversed so children are popped (and their effects run) in render order
+            children = list(model_state.children_by_key.values())
+            children.reverse()
+            to_visit.extend(children)
 
         old_model: Optional[VdomJson]
         try:
-            old_model = old_state.model.current
+            old_model = old_state.model
         except AttributeError:
             old_model = None
 
         return LayoutUpdate(
             path=new_state.patch_path,
             old=old_model,
-            new=new_state.model.current,
+            new=new_state.model,
         )
 
     def _render_component(
@@ -190,43 +236,49 @@ class Layout:
         life_cycle_state = new_state.life_cycle_state
         self._model_states_by_life_cycle_state_id[life_cycle_state.id] = new_state
 
-        life_cycle_hook = life_cycle_state.hook
-        life_cycle_hook.component_will_render()
+        if old_state is not None and not _component_should_render(old_state, new_state):
+            _reuse_model_state(old_state, new_state)
+        else:
+            life_cycle_hook = life_cycle_state.hook
+            life_cycle_hook.component_will_render()
 
-        try:
-            life_cycle_hook.set_current()
             try:
-                raw_model = component.render()
-            finally:
-                life_cycle_hook.unset_current()
-            self._render_model(old_state, new_state, raw_model)
-        except Exception as error:
-            logger.exception(f"Failed to render {component}")
-            new_state.model.current = {
-                "tagName": "",
-                "error": (
-                    f"{type(error).__name__}: {error}"
-                    if IDOM_DEBUG_MODE.current
-                    else ""
-                ),
-            }
-        try:
-            parent = new_state.parent
-        except AttributeError:
-            pass
-        else:
+                life_cycle_hook.set_current()
+                try:
+                    raw_model = component.render()
+                finally:
+                    life_cycle_hook.unset_current()
+                if (
+                    IDOM_REUSE_EQUAL_MODELS.current
+                    and old_state is not None
+                    # dict and list comparisons check identity before equality
+                    and raw_model == old_state.raw_model
+                ):
+                    _reuse_model_state(old_state, new_state)
+                else:
+                    self._render_model(old_state, new_state, raw_model)
+            except Exception as error:
+                logger.exception(f"Failed to render {component}")
+                new_state.model = {
+                    "tagName": "",
+                    "error": (
+                        f"{type(error).__name__}: {error}"
+                        if IDOM_DEBUG_MODE.current
+                        else ""
+                    ),
+                }
+        parent = new_state.parent
+        if parent is not None:
             key, index = new_state.key, new_state.index
+            # keyed components may move amongst their siblings so only check the key
             if old_state is not None:
-                assert (key, index) == (old_state.key, old_state.index,), (
+                assert key == old_state.key, (
                     "state mismatch during component update - "
-                    f"key {key!r}!={old_state.key} "
-                    f"or index {index}!={old_state.index}"
+                    f"key {key!r}!={old_state.key!r}"
                 )
             parent.children_by_key[key] = new_state
             # need to do insertion in case where old_state is None and we're appending
-            parent.model.current["children"][index : index + 1] = [
-                new_state.model.current
-            ]
+            parent.model["children"][index : index + 1] = [new_state.model]
 
     def _render_model(
         self,
@@ -234,15 +286,36 @@ class Layout:
         new_state: _ModelState,
         raw_model: Any,
     ) -> None:
-        new_state.model.current = {"tagName": raw_model["tagName"]}
+        if old_state is not None and raw_model is old_state.raw_model:
+            # the exact same VDOM was returned (e.g. it was hoisted or memoized) so
+            # the model that was previously rendered from it can be reused
+            _reuse_model_state(old_state, new_state)
+            return None
 
-        self._render_model_attributes(old_state, new_state, raw_model)
-        self._render_model_children(old_state, new_state, raw_model.get("children", []))
+        new_state.model = {"tagName": raw_model["tagName"]}
+
+        # Many elements have no attributes, handlers, or children. Avoid calling these
+        # methods for them unless there is old state which needs to be cleaned up.
+        if (
+            "attributes" in raw_model
+            or "eventHandlers" in raw_model
+            or (old_state is not None and old_state.targets_by_event)
+        ):
+            self._render_model_attributes(old_state, new_state, raw_model)
+        if "children" in raw_model or (
+            old_state is not None and old_state.children_by_key
+        ):
+            self._render_model_children(
+                old_state, new_state, raw_model.get("children", [])
+            )
 
         if "key" in raw_model:
-            new_state.model.current["key"] = raw_model["key"]
+            new_state.model["key"] = raw_model["key"]
         if "importSource" in raw_model:
-            new_state.model.current["importSource"] = raw_model["importSource"]
+            new_state.model["importSource"] = raw_model["importSource"]
+
+        # only record this once rendering has succeeded
+        new_state.raw_model = raw_model
 
     def _render_model_attributes(
         self,
@@ -255,7 +328,7 @@ class Layout:
 
         if "attributes" in raw_model:
             attrs = raw_model["attributes"].copy()
-            new_state.model.current["attributes"] = attrs
+            new_state.model["attributes"] = attrs
 
         if old_state is None:
             self._render_model_event_handlers_without_old_state(
@@ -270,11 +343,11 @@ class Layout:
         if not handlers_by_event:
             return None
 
-        model_event_handlers = new_state.model.current["eventHandlers"] = {}
+        model_event_handlers = new_state.model["eventHandlers"] = {}
         for event, handler in handlers_by_event.items():
             target = old_state.targets_by_event.get(
                 event,
-                uuid4().hex if handler.target is None else handler.target,
+                self._new_target() if handler.target is None else handler.target,
             )
             new_state.targets_by_event[event] = target
             self._event_handlers[target] = handler
@@ -294,9 +367,9 @@ class Layout:
         if not handlers_by_event:
             return None
 
-        model_event_handlers = new_state.model.current["eventHandlers"] = {}
+        model_event_handlers = new_state.model["eventHandlers"] = {}
         for event, handler in handlers_by_event.items():
-            target = uuid4().hex if handler.target is None else handler.target
+            target = self._new_target() if handler.target is None else handler.target
             new_state.targets_by_event[event] = target
             self._event_handlers[target] = handler
             model_event_handlers[event] = {
@@ -324,23 +397,57 @@ class Layout:
             self._unmount_model_states(list(old_state.children_by_key.values()))
             return None
 
-        child_type_key_tuples = list(_process_child_type_and_key(raw_children))
+        # Determine the type and key of each child, while collecting the keys of those
+        # which have model states. This is done inline (rather than in a helper) since
+        # it happens for every child on every render.
+        child_type_key_tuples: List[Tuple[Any, _ElementType, Any]] = []
+        all_new_keys: Set[Any] = set()
+        duplicate_keys: List[Any] = []
+        new_keys: List[Any] = []
+        for index, child in enumerate(raw_children):
+            child_class = type(child)
+            if child_class is dict:
+                child_type = _DICT_TYPE
+                key = child.get("key")
+            elif child_class is str:
+                child_type = _STRING_TYPE
+                key = None
+            elif isinstance(child, dict):
+                child_type = _DICT_TYPE
+                key = child.get("key")
+            elif isinstance(child, ComponentType):
+                child_type = _COMPONENT_TYPE
+                key = getattr(child, "key", None)
+            else:
+                child = f"{child}"
+                child_type = _STRING_TYPE
+                key = None
+
+            if key is None:
+                key = _default_key(index)
 
-        new_keys = {item[2] for item in child_type_key_tuples}
-        if len(new_keys) != len(raw_children):
-            key_counter = Counter(item[2] for item in child_type_key_tuples)
-            duplicate_keys = [key for key, count in key_counter.items() if count > 1]
+            if key in all_new_keys:
+                duplicate_keys.append(key)
+            else:
+                all_new_keys.add(key)
+                if child_type is not _STRING_TYPE:
+                    new_keys.append(key)
+
+            child_type_key_tuples.append((child, child_type, key))
+
+        if duplicate_keys:
             raise ValueError(
-                f"Duplicate keys {duplicate_keys} at {new_state.patch_path or '/'!r}"
+                f"Duplicate keys {list(dict.fromkeys(duplicate_keys))} "
+                f"at {new_state.patch_path or '/'!r}"
             )
 
-        old_keys = set(old_state.children_by_key).difference(new_keys)
+        old_keys = _removed_child_keys(list(old_state.children_by_key), new_keys)
         if old_keys:
             self._unmount_model_states(
                 [old_state.children_by_key[key] for key in old_keys]
             )
 
-        new_children = new_state.model.current["children"] = []
+        new_children = new_state.model["children"] = []
         for index, (child, child_type, key) in enumerate(child_type_key_tuples):
             if child_type is _DICT_TYPE:
                 old_child_state = old_state.children_by_key.get(key)
@@ -357,7 +464,7 @@ class Layout:
                         index,
                     )
                 self._render_model(old_child_state, new_child_state, child)
-                new_children.append(new_child_state.model.current)
+                new_children.append(new_child_state.model)
                 new_state.children_by_key[key] = new_child_state
             elif child_type is _COMPONENT_TYPE:
                 old_child_state = old_state.children_by_key.get(key)
@@ -367,6 +474,7 @@ class Layout:
                         index,
                         key,
                         child,
+                        self._new_life_cycle_state_id(),
                         self._rendering_queue.put,
                     )
                 else:
@@ -383,22 +491,34 @@ class Layout:
     def _render_model_children_without_old_state(
         self, new_state: _ModelState, raw_children: List[Any]
     ) -> None:
-        new_children = new_state.model.current["children"] = []
-        for index, (child, child_type, key) in enumerate(
-            _process_child_type_and_key(raw_children)
-        ):
-            if child_type is _DICT_TYPE:
+        new_children = new_state.model["children"] = []
+        for index, child in enumerate(raw_children):
+            child_class = type(child)
+            if child_class is str:
+                new_children.append(child)
+            elif child_class is dict or isinstance(child, dict):
+                key = child.get("key")
+                if key is None:
+                    key = _default_key(index)
                 child_state = _make_element_model_state(new_state, index, key)
                 self._render_model(None, child_state, child)
-                new_children.append(child_state.model.current)
+                new_children.append(child_state.model)
                 new_state.children_by_key[key] = child_state
-            elif child_type is _COMPONENT_TYPE:
+            elif isinstance(child, ComponentType):
+                key = getattr(child, "key", None)
+                if key is None:
+                    key = _default_key(index)
                 child_state = _make_component_model_state(
-                    new_state, index, key, child, self._rendering_queue.put
+                    new_state,
+                    index,
+                    key,
+                    child,
+                    self._new_life_cycle_state_id(),
+                    self._rendering_queue.put,
                 )
                 self._render_component(None, child_state, child)
             else:
-                new_children.append(child)
+                new_children.append(f"{child}")
 
     def _unmount_model_states(self, old_states: List[_ModelState]) -> None:
         to_unmount = old_states[::-1]  # unmount in reversed order of rendering
@@ -414,29 +534,56 @@ class Layout:
                 life_cycle_state.hook.component_will_unmount()
 
             to_unmount.extend(model_state.children_by_key.values())
+            _detach_model_state(model_state)
+
+    def _new_target(self) -> str:
+        # targets only need to be unique within this layout so a counter is sufficient
+        return f"t{next(self._target_counter):x}"
+
+    def _new_life_cycle_state_id(self) -> _LifeCycleStateId:
+        return _LifeCycleStateId(self._new_target())
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.root})"
 
 
-def _iter_model_state_children(model_state: _ModelState) -> Iterator[_ModelState]:
-    yield model_state
-    for child in model_state.children_by_key.values():
-        yield from _iter_model_state_children(child)
+def _removed_child_keys(old_keys: List[Any], new_keys: List[Any]) -> Set[Any]:
+    # Skip over the keys shared at the start and end of both lists since in the common
+    # case (e.g. appending an item) only the keys in the middle will have changed.
+    head = 0
+    stop = min(len(old_keys), len(new_keys))
+    while head < stop and old_keys[head] == new_keys[head]:
+        head += 1
+
+    old_stop, new_stop = len(old_keys), len(new_keys)
+    while (
+        old_stop > head
+        and new_stop > head
+        and old_keys[old_stop - 1] == new_keys[new_stop - 1]
+    ):
+        old_stop -= 1
+        new_stop -= 1
+
+    if old_stop == head:
+        return set()
+
+    return set(old_keys[head:old_stop]).difference(new_keys[head:new_stop])
 
 
 def _new_root_model_state(
-    component: ComponentType, schedule_render: Callable[[_LifeCycleStateId], None]
+    component: ComponentType,
+    life_cycle_state_id: _LifeCycleStateId,
+    schedule_render: Callable[[_LifeCycleStateId], None],
 ) -> _ModelState:
     return _ModelState(
         parent=None,
         index=-1,
         key=None,
-        model=Ref(),
-        patch_path="",
         children_by_key={},
         targets_by_event={},
-        life_cycle_state=_make_life_cycle_state(component, schedule_render),
+        life_cycle_state=_make_life_cycle_state(
+            component, life_cycle_state_id, schedule_render
+        ),
     )
 
 
@@ -445,34 +592,26 @@ def _make_component_model_state(
     index: int,
     key: Any,
     component: ComponentType,
+    life_cycle_state_id: _LifeCycleStateId,
     schedule_render: Callable[[_LifeCycleStateId], None],
 ) -> _ModelState:
     return _ModelState(
         parent=parent,
         index=index,
         key=key,
-        model=Ref(),
-        patch_path=f"{parent.patch_path}/children/{index}",
         children_by_key={},
         targets_by_event={},
-        life_cycle_state=_make_life_cycle_state(component, schedule_render),
+        life_cycle_state=_make_life_cycle_state(
+            component, life_cycle_state_id, schedule_render
+        ),
     )
 
 
 def _copy_component_model_state(old_model_state: _ModelState) -> _ModelState:
-
-    # use try/except here because not having a parent is rare (only the root state)
-    try:
-        parent: Optional[_ModelState] = old_model_state.parent
-    except AttributeError:
-        parent = None
-
     return _ModelState(
-        parent=parent,
+        parent=old_model_state.parent,
         index=old_model_state.index,
         key=old_model_state.key,
-        model=Ref(),  # does not copy the model
-        patch_path=old_model_state.patch_path,
         children_by_key={},
         targets_by_event={},
         life_cycle_state=old_model_state.life_cycle_state,
@@ -493,16 +632,43 @@ def _update_component_model_state(
             f"{old_model_state.key!r} - prior element with this key wasn't a component"
         )
 
-    return _ModelState(
+    new_model_state = _ModelState(
         parent=new_parent,
         index=new_index,
         key=old_model_state.key,
-        model=Ref(),  # does not copy the model
-        patch_path=old_model_state.patch_path,
         children_by_key={},
         targets_by_event={},
         life_cycle_state=_update_life_cycle_state(old_life_cycle_state, new_component),
     )
+    _detach_model_state(old_model_state)
+    return new_model_state
+
+
+def _component_should_render(old_state: _ModelState, new_state: _ModelState) -> bool:
+    old_life_cycle_state = old_state.life_cycle_state
+    new_life_cycle_state = new_state.life_cycle_state
+
+    if old_life_cycle_state is new_life_cycle_state:
+        # the component scheduled its own render so its state must have changed
+        return True
+
+    old_component = old_life_cycle_state.component
+    new_component = new_life_cycle_state.component
+
+    if old_component is new_component:
+        return False
+
+    should_render = getattr(new_component, "should_render", None)
+    return should_render is None or bool(should_render(old_component))
+
+
+def _reuse_model_state(old_state: _ModelState, new_state: _ModelState) -> None:
+    new_state.raw_model = old_state.raw_model
+    new_state.model = old_state.model
+    new_state.children_by_key = old_state.children_by_key
+    new_state.targets_by_event = old_state.targets_by_event
+    for child_state in new_state.children_by_key.values():
+        child_state.parent = new_state
 
 
 def _make_element_model_state(
@@ -514,8 +680,6 @@ def _make_element_model_state(
         parent=parent,
         index=index,
         key=key,
-        model=Ref(),
-        patch_path=f"{parent.patch_path}/children/{index}",
         children_by_key={},
         targets_by_event={},
     )
@@ -532,15 +696,22 @@ def _update_element_model_state(
             f"{old_model_state.key!r} - prior element with this key was a component"
         )
 
-    return _ModelState(
+    new_model_state = _ModelState(
         parent=new_parent,
         index=new_index,
         key=old_model_state.key,
-        model=Ref(),  # does not copy the model
-        patch_path=old_model_state.patch_path,
-        children_by_key=old_model_state.children_by_key.copy(),
+        children_by_key={},
         targets_by_event={},
     )
+    _detach_model_state(old_model_state)
+    return new_model_state
+
+
+def _detach_model_state(model_state: _ModelState) -> None:
+    # Parents are strongly referenced so we must break the reference cycle between an
+    # old state and its parent once it has been replaced or unmounted. Otherwise they
+    # (along with their models and event handlers) linger until a full GC cycle.
+    model_state.parent = None
 
 
 class _ModelState:
@@ -548,68 +719,75 @@ class _ModelState:
 
     __slots__ = (
         "__weakref__",
-        "_parent_ref",
         "children_by_key",
         "index",
         "key",
         "life_cycle_state",
         "model",
-        "patch_path",
+        "parent",
+        "raw_model",
         "targets_by_event",
     )
 
+    model: VdomJson
+    """The actual model of the element (assigned when the element is rendered)"""
+
     def __init__(
         self,
         parent: Optional[_ModelState],
         index: int,
         key: Any,
-        model: Ref[VdomJson],
-        patch_path: str,
         children_by_key: Dict[str, _ModelState],
         targets_by_event: Dict[str, str],
         life_cycle_state: Optional[_LifeCycleState] = None,
     ):
+        self.parent = parent
+        """The parent model state (``None`` for the root or once detached)"""
+
         self.index = index
         """The index of the element amongst its siblings"""
 
         self.key = key
         """A key that uniquely identifies the element amongst its siblings"""
 
-        self.model = model
-        """The actual model of the element"""
-
-        self.patch_path = patch_path
-        """A "/" delimitted path to the element within the greater layout"""
-
         self.children_by_key = children_by_key
         """Child model states indexed by their unique keys"""
 
         self.targets_by_event = targets_by_event
         """The element's event handler target strings indexed by their event name"""
 
+        self.raw_model: Any = None
+        """The VDOM this element's model was last rendered from"""
+
         # === Conditionally Available Attributes ===
         # It's easier to conditionally assign than to force a null check on every usage
 
-        if parent is not None:
-            self._parent_ref = weakref(parent)
-            """The parent model state"""
-
         if life_cycle_state is not None:
             self.life_cycle_state = life_cycle_state
             """The state for the element's component (if it has one)"""
 
     @property
-    def parent(self) -> _ModelState:
-        parent = self._parent_ref()
-        assert parent is not None, "detached model state"
-        return parent
+    def patch_path(self) -> str:
+        """A "/" delimitted path to the element within the greater layout
+
+        This is derived from the parents of the element rather than stored since it is
+        only needed when an update is emitted and it changes whenever an ancestor moves.
+        """
+        segments: List[str] = []
+        model_state = self
+        parent = model_state.parent
+        while parent is not None:
+            segments.append(f"/children/{model_state.index}")
+            model_state, parent = parent, parent.parent
+        segments.reverse()
+        return "".join(segments)
 
 
 def _make_life_cycle_state(
     component: ComponentType,
+    life_cycle_state_id: _LifeCycleStateId,
     schedule_render: Callable[[_LifeCycleStateId], None],
 ) -> _LifeCycleState:
-    life_cycle_state_id = _LifeCycleStateId(uuid4().hex)
     return _LifeCycleState(
         life_cycle_state_id,
         LifeCycleHook(lambda: schedule_render(life_cycle_state_id)),
@@ -650,47 +828,41 @@ _Type = TypeVar("_Type")
 
 class _ThreadSafeQueue(Generic[_Type]):
 
-    __slots__ = "_loop", "_queue", "_pending"
+    __slots__ = "_loop", "_queue", "_pending", "_batch", "_flush_scheduled"
 
     def __init__(self) -> None:
         self._loop = asyncio.get_event_loop()
         self._queue: asyncio.Queue[_Type] = asyncio.Queue()
         self._pending: Set[_Type] = set()
+        self._batch: List[_Type] = []
+        self._flush_scheduled = False
 
     def put(self, value: _Type) -> None:
         if value not in self._pending:
             self._pending.add(value)
-            self._loop.call_soon_threadsafe(self._queue.put_nowait, value)
+            # Values put during the same tick of the event loop are transferred to the
+            # queue together by a single callback rather than one callback per value.
+            self._batch.append(value)
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                self._loop.call_soon_threadsafe(self._flush)
         return None
 
+    def _flush(self) -> None:
+        # reset the flag before taking the batch so that any value added to a new batch
+        # from another thread will schedule another flush
+        self._flush_scheduled = False
+        batch, self._batch = self._batch, []
+        for value in batch:
+            self._queue.put_nowait(value)
+
     async def get(self) -> _Type:
         value = await self._queue.get()
         self._pending.remove(value)
         return value
 
 
-def _process_child_type_and_key(
-    children: List[Any],
-) -> Iterator[Tuple[Any, _ElementType, Any]]:
-    for index, child in enumerate(children):
-        if isinstance(child, dict):
-            child_type = _DICT_TYPE
-            key = child.get("key")
-        elif isinstance(child, ComponentType):
-            child_type = _COMPONENT_TYPE
-            key = getattr(child, "key", None)
-        else:
-            child = f"{child}"
-            child_type = _STRING_TYPE
-            key = None
-
-        if key is None:
-            key = _default_key(index)
-
-        yield (child, child_type, key)
-
-
-# used in _process_child_type_and_key
+# used in _render_model_children
 _ElementType = NewType("_ElementType", int)
 _DICT_TYPE = _ElementType(1)
 _COMPONENT_TYPE = _ElementType(2)
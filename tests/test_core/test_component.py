@@ -1,4 +1,6 @@
 import idom
+from idom.config import IDOM_FEATURE_HOIST_STATIC_MODELS
+from idom.testing import HookCatcher
 
 
 def test_component_repr():
@@ -71,3 +73,77 @@ def test_pre_tags_are_rendered_correctly(driver, display):
         pre.get_attribute("innerHTML")
         == "<span>this<span>is</span>some</span>pre-formated text"
     )
+
+
+async def test_memo_skips_render_when_props_are_equal():
+    parent_hook = HookCatcher()
+    render_counts = {"memo": 0, "other": 0}
+
+    @idom.component
+    @parent_hook.capture
+    def Parent():
+        return idom.html.div(
+            [MemoChild("memo", key="a"), MemoChild(name="other", extra=[], key="b")]
+        )
+
+    @idom.memo
+    @idom.component
+    def MemoChild(name, extra=None):
+        render_counts[name] += 1
+        return idom.html.div(name)
+
+    with idom.Layout(Parent()) as layout:
+        await layout.render()
+        assert render_counts == {"memo": 1, "other": 1}
+
+        parent_hook.latest.schedule_render()
+        await layout.render()
+        assert render_counts == {"memo": 1, "other": 1}
+
+
+async def test_memo_with_custom_equality():
+    parent_hook = HookCatcher()
+    render_count = idom.Ref(0)
+
+    @idom.component
+    @parent_hook.capture
+    def Parent():
+        return Child(key="child")
+
+    @idom.component
+    def Child():
+        render_count.current += 1
+        return idom.html.div()
+
+    Child = idom.memo(Child, are_equal=lambda old, new: False)
+
+    with idom.Layout(Parent()) as layout:
+        await layout.render()
+        parent_hook.latest.schedule_render()
+        await layout.render()
+        assert render_count.current == 2
+
+
+def test_hoist_static_models():
+    IDOM_FEATURE_HOIST_STATIC_MODELS.current = True
+    try:
+
+        @idom.component
+        def Static():
+            """This is static"""
+            return {"tagName": "div", "children": [{"tagName": "hr"}, "text"]}
+
+        @idom.component
+        def NotStatic(value):
+            return {"tagName": "div", "children": [value]}
+
+    finally:
+        IDOM_FEATURE_HOIST_STATIC_MODELS.unset()
+
+    assert Static().render() is Static().render()
+    assert Static().render() == {
+        "tagName": "div",
+        "children": [{"tagName": "hr"}, "text"],
+    }
+    assert NotStatic(1).render() == {"tagName": "div", "children": [1]}
+    assert NotStatic(1).render() is not NotStatic(1).render()
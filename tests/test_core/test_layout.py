@@ -7,9 +7,9 @@ from weakref import ref as weakref
 import pytest
 
 import idom
-from idom.config import IDOM_DEBUG_MODE
+from idom.config import IDOM_DEBUG_MODE, IDOM_REUSE_EQUAL_MODELS
 from idom.core.dispatcher import render_json_patch
-from idom.core.layout import LayoutEvent
+from idom.core.layout import LayoutEvent, LayoutUpdate
 from idom.testing import HookCatcher, StaticEventHandler
 from tests.general_utils import assert_same_items
 
@@ -31,6 +31,19 @@ def test_layout_expects_abstract_component():
         idom.Layout(idom.html.div())
 
 
+def test_layout_update_and_event_behave_like_tuples():
+    update = LayoutUpdate(path="/a", old=None, new={"tagName": "div"})
+    path, old, new = update
+    assert (path, old, new) == ("/a", None, {"tagName": "div"})
+    assert update == LayoutUpdate("/a", None, {"tagName": "div"})
+    assert update != LayoutUpdate("/b", None, {"tagName": "div"})
+    assert repr(update) == "LayoutUpdate(path='/a', old=None, new={'tagName': 'div'})"
+
+    event = LayoutEvent(**{"target": "t0", "data": [1]})
+    assert tuple(event) == ("t0", [1])
+    assert event == LayoutEvent("t0", [1])
+
+
 async def test_layout_cannot_be_used_outside_context_manager(caplog):
     @idom.component
     def Component():
@@ -767,3 +780,251 @@ async def test_layout_component_cannot_become_an_element(caplog):
 
     error = caplog.records[0].exc_info[1]
     assert "prior element with this key was a component" in str(error)
+
+
+async def test_generated_event_handler_targets_are_unique():
+    @idom.component
+    def ManyButtons():
+        return idom.html.div(
+            [idom.html.button({"onClick": lambda event: None}) for _ in range(3)]
+        )
+
+    with idom.Layout(ManyButtons()) as layout:
+        update = await layout.render()
+
+    targets = [
+        child["eventHandlers"]["onClick"]["target"] for child in update.new["children"]
+    ]
+    assert len(set(targets)) == len(targets)
+
+
+async def test_same_component_instance_is_not_rerendered():
+    parent_hook = HookCatcher()
+    child_hook = HookCatcher()
+    child_render_count = idom.Ref(0)
+
+    @idom.component
+    @parent_hook.capture
+    def Parent():
+        return idom.html.div(child)
+
+    @idom.component
+    @child_hook.capture
+    def Child():
+        child_render_count.current += 1
+        return idom.html.div(Grandchild(key="grandchild"))
+
+    grandchild_hook = HookCatcher()
+
+    @idom.component
+    @grandchild_hook.capture
+    def Grandchild():
+        return idom.html.div()
+
+    child = Child(key="child")
+
+    with idom.Layout(Parent()) as layout:
+        await layout.render()
+        assert child_render_count.current == 1
+
+        parent_hook.latest.schedule_render()
+        await layout.render()
+        assert child_render_count.current == 1
+
+        # the child still re-renders when its own state changes
+        child_hook.latest.schedule_render()
+        await layout.render()
+        assert child_render_count.current == 2
+
+        # and descendants of a reused child can still update themselves
+        parent_hook.latest.schedule_render()
+        await layout.render()
+        grandchild_hook.latest.schedule_render()
+        update = await layout.render()
+        assert update.path == "/children/0/children/0"
+
+
+async def test_identical_vdom_reuses_prior_model():
+    hook = HookCatcher()
+    static_view = idom.html.div(idom.html.p("static"), key="static")
+
+    @idom.component
+    @hook.capture
+    def HasStaticView():
+        count, set_count = idom.hooks.use_state(0)
+        return idom.html.div(count, static_view)
+
+    with idom.Layout(HasStaticView()) as layout:
+        first = await layout.render()
+
+        hook.latest.schedule_render()
+        second = await layout.render()
+
+    assert second.new["children"][1] is first.new["children"][1]
+
+
+async def test_keyed_element_children_can_be_removed_repeatedly(caplog):
+    set_items = idom.Ref()
+
+    @idom.component
+    def Outer():
+        items, set_items.current = idom.hooks.use_state(["a", "b", "c", "d"])
+        return idom.html.div(
+            idom.html.ul(
+                [
+                    idom.html.li({"onClick": lambda event: None}, item, key=item)
+                    for item in items
+                ],
+                key="list",
+            )
+        )
+
+    with idom.Layout(Outer()) as layout:
+        await layout.render()
+
+        for items in (["a", "b", "c"], ["a", "c"], ["z", "a", "c"], ["c"]):
+            set_items.current(items)
+            update = await layout.render()
+            assert [li["key"] for li in update.new["children"][0]["children"]] == items
+
+    assert not caplog.records
+
+
+async def test_renders_scheduled_together_are_all_delivered():
+    hooks = [HookCatcher() for _ in range(3)]
+    render_counts = [0] * len(hooks)
+
+    def make_child(index):
+        @idom.component
+        @hooks[index].capture
+        def Child():
+            render_counts[index] += 1
+            return idom.html.div()
+
+        return Child
+
+    children = [make_child(i) for i in range(len(hooks))]
+
+    @idom.component
+    def Parent():
+        return idom.html.div([Child(key=str(i)) for i, Child in enumerate(children)])
+
+    with idom.Layout(Parent()) as layout:
+        await layout.render()
+
+        for hook in hooks:
+            hook.latest.schedule_render()
+
+        paths = {(await layout.render()).path for _ in hooks}
+
+    assert paths == {"/children/0", "/children/1", "/children/2"}
+    assert render_counts == [2, 2, 2]
+
+
+async def test_element_with_only_a_tag_name_cleans_up_old_state(caplog):
+    set_bare = idom.Ref()
+    handler = StaticEventHandler()
+    child_unmounted = idom.Ref(False)
+
+    @idom.component
+    def Root():
+        bare, set_bare.current = idom.hooks.use_state(False)
+        if bare:
+            return {"tagName": "div", "children": [{"tagName": "button", "key": "b"}]}
+        return idom.html.div(
+            idom.html.button(
+                {"onClick": handler.use(lambda event: None)}, Child(), key="b"
+            )
+        )
+
+    @idom.component
+    def Child():
+        idom.hooks.use_effect(lambda: lambda: child_unmounted.set_current(True))
+        return idom.html.div()
+
+    with idom.Layout(Root()) as layout:
+        await layout.render()
+
+        set_bare.current(True)
+        update = await layout.render()
+        assert update.new["children"] == [{"tagName": "button", "key": "b"}]
+        assert child_unmounted.current
+
+        await layout.deliver(LayoutEvent(handler.target, []))
+
+    assert caplog.records[-1].msg.startswith("Ignored event")
+
+
+async def test_equal_vdom_reuses_prior_model_when_enabled():
+    hook = HookCatcher()
+
+    @idom.component
+    @hook.capture
+    def SameEveryTime():
+        return idom.html.div(idom.html.p("hello"))
+
+    IDOM_REUSE_EQUAL_MODELS.current = True
+    try:
+        with idom.Layout(SameEveryTime()) as layout:
+            first = await layout.render()
+
+            hook.latest.schedule_render()
+            second = await layout.render()
+    finally:
+        IDOM_REUSE_EQUAL_MODELS.unset()
+
+    assert second.new is first.new
+
+
+async def test_replaced_model_states_do_not_create_reference_cycles():
+    hook = HookCatcher()
+
+    @idom.component
+    @hook.capture
+    def Root():
+        return idom.html.div(
+            idom.html.ul([idom.html.li(Child(), key=str(i)) for i in range(3)]),
+            key="root",
+        )
+
+    @idom.component
+    def Child():
+        return idom.html.div(idom.html.span("hello"))
+
+    with idom.Layout(Root()) as layout:
+        await layout.render()
+
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(3):
+                hook.latest.schedule_render()
+                await layout.render()
+            assert gc.collect() == 0
+        finally:
+            gc.enable()
+
+
+async def test_update_path_follows_keyed_component_that_moved():
+    set_order = idom.Ref()
+    child_hooks = {}
+
+    @idom.component
+    def Parent():
+        order, set_order.current = idom.hooks.use_state(["a", "b"])
+        return idom.html.div([Child(name, key=name) for name in order])
+
+    @idom.component
+    def Child(name):
+        child_hooks[name] = idom.hooks.current_hook()
+        return idom.html.div(name)
+
+    with idom.Layout(Parent()) as layout:
+        await layout.render()
+
+        set_order.current(["b", "a"])
+        await layout.render()
+
+        child_hooks["b"].schedule_render()
+        update = await asyncio.wait_for(layout.render(), 1)
+        assert update.path == "/children/0"